@@ -0,0 +1,125 @@
+import argparse
+import json
+import multiprocessing
+import sys
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+from manim import ImageMobject, MathTex, Wait, config, tempconfig
+from manim.utils.family import extract_mobject_family_members
+
+from benchmark import run_case
+from render import QUALITIES
+from scene import CoDEx
+
+
+class TimelineAnalyzer:
+    # Runs a scene with every play skipped, so construct runs and the mobjects reach each play's end
+    # state without anything being rasterized or encoded, and records per section what a real render does
+    def __init__(self, scene):
+        self.frame_rate = config.frame_rate
+        self.sections = defaultdict(lambda: {"duration": 0, "plays": 0, "waits": 0, "frames": 0, "peak_mobjects": 0,
+                                             "images": set(), "tex": set()})
+        play = scene.renderer.play
+
+        def analyzed_play(scene, *args, **kwargs):
+            before = extract_mobject_family_members(scene.mobjects)
+            play(scene, *args, **kwargs)
+            self.record(scene, before)
+
+        scene.renderer.play = analyzed_play
+
+    def record(self, scene, before):
+        section = scene.renderer.file_writer.sections[-1]
+        # Sections a real render skips too, like the state recreated before a section rendered on its own
+        if section.skip_animations:
+            return
+        stats = self.sections[section.name]
+        stats["waits" if all(isinstance(a, Wait) for a in scene.animations) else "plays"] += 1
+        stats["duration"] += scene.duration
+        stats["frames"] += int(np.ceil(scene.duration*self.frame_rate - 1e-9))
+
+        after = extract_mobject_family_members([*scene.mobjects, *(a.mobject for a in scene.animations)])
+        stats["peak_mobjects"] = max(stats["peak_mobjects"], len(before), len(after))
+        for mobject in [*before, *after]:
+            if isinstance(mobject, ImageMobject):
+                stats["images"].add(mobject)
+            elif isinstance(mobject, MathTex):
+                stats["tex"].add(mobject.tex_string)
+
+    def report(self):
+        return {
+            name: {**stats, "images": len(stats["images"]), "tex": len(stats["tex"])}
+            for name, stats in self.sections.items()
+        }
+
+
+def analyze(sections, quality, seed, draft=False):
+    with tempconfig({"quality": QUALITIES[quality], "dry_run": True, "disable_caching": True, "verbosity": "WARNING"}):
+        scene = CoDEx(sections=sections, random_seed=seed, draft=draft, skip_animations=True)
+        analyzer = TimelineAnalyzer(scene)
+        scene.render()
+    return analyzer.report()
+
+
+def calibrate(section, quality, seed):
+    # A real render of one (short) section, in its own process so its peak RSS is its own
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as pool:
+        return pool.submit(run_case, section, quality, seed).result()
+
+
+def estimate(report, calibration, quality):
+    # Wall time from the measured seconds per frame of the same section, or of all measured sections
+    # at this quality on average, and peak memory likewise
+    measured = {case["section"]: case for case in calibration if case["quality"] == quality and case["frames"]}
+    if not measured:
+        return
+    seconds_per_frame = np.mean([case["wall_time"]/case["frames"] for case in measured.values()])
+    memory = np.mean([case["peak_rss_mb"] for case in measured.values()])
+    for name, stats in report.items():
+        case = measured.get(name)
+        stats["est_wall_time"] = stats["frames"]*(case["wall_time"]/case["frames"] if case else seconds_per_frame)
+        stats["est_peak_rss_mb"] = case["peak_rss_mb"] if case else memory
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Dry-run CoDEx and predict what rendering it costs")
+    parser.add_argument("-s", "--sections", nargs="+", choices=CoDEx.sections, default=list(CoDEx.sections))
+    parser.add_argument("-q", "--quality", choices=QUALITIES, default="h")
+    parser.add_argument("-d", "--draft", action="store_true")
+    parser.add_argument("-c", "--calibration", type=Path, default=Path("benchmarks/results.json"),
+                        help="benchmark.py results to take the measured cost per frame from")
+    parser.add_argument("--calibrate", choices=CoDEx.sections, metavar="SECTION",
+                        help="measure the cost per frame with a real render of this section first")
+    parser.add_argument("--json", type=Path, help="also write the report here")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    report = analyze(args.sections, args.quality, args.seed, args.draft)
+    calibration = json.loads(args.calibration.read_text()) if args.calibration.exists() else []
+    if args.calibrate:
+        calibration = [case for case in calibration if case["section"] != args.calibrate]
+        calibration.append(calibrate(args.calibrate, args.quality, args.seed))
+    estimate(report, calibration, args.quality)
+
+    print(f"{'section':>12} {'duration':>9} {'plays':>6} {'waits':>6} {'frames':>7} {'mobjects':>9} "
+          f"{'images':>7} {'tex':>5} {'est. time':>10} {'est. RSS':>9}")
+    for name, stats in report.items():
+        estimates = (f"{stats['est_wall_time']:9.0f}s {stats['est_peak_rss_mb']:6.0f} MB"
+                     if "est_wall_time" in stats else f"{'n/a':>10} {'n/a':>9}")
+        print(f"{name:>12} {stats['duration']:8.1f}s {stats['plays']:6d} {stats['waits']:6d} {stats['frames']:7d} "
+              f"{stats['peak_mobjects']:9d} {stats['images']:7d} {stats['tex']:5d} {estimates}")
+    total = {key: sum(stats[key] for stats in report.values()) for key in ("duration", "plays", "waits", "frames")}
+    total_time = sum(stats.get("est_wall_time", 0) for stats in report.values())
+    print(f"{'total':>12} {total['duration']:8.1f}s {total['plays']:6d} {total['waits']:6d} {total['frames']:7d}"
+          + (f"{'':>25}{total_time:9.0f}s" if total_time else ""))
+
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,196 @@
+import ast
+import csv
+import hashlib
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+from manim import ImageMobject, config, logger, tempconfig
+from manim.constants import DEFAULT_QUALITY, QUALITIES
+from manim.utils.images import get_full_raster_image_path
+from manim.utils.tex_file_writing import delete_nonsvg_files, generate_tex_file, tex_to_svg_file
+
+
+# Decoded pixels shared by every ImageMobject made from the same file at the same size
+decoded_images = {}
+
+
+def resized_image(path, height):
+    # Resized variants are cached on disk, keyed by the source's content and the target height
+    image = Image.open(path)
+    if height >= image.height:
+        return image
+    digest = hashlib.sha1(path.read_bytes()).hexdigest()[:16]
+    cached = Path(config.media_dir) / "cache" / "images" / f"{path.stem}_{digest}_{height}.png"
+    if not cached.exists():
+        cached.parent.mkdir(parents=True, exist_ok=True)
+        width = max(1, round(image.width*height/image.height))
+        # Written under a temporary name so concurrent renders never open a partial file
+        temp = cached.with_name(f"{cached.stem}.{os.getpid()}.tmp.png")
+        image.convert("RGBA").resize((width, height), Image.LANCZOS).save(temp)
+        os.replace(temp, cached)
+    return Image.open(cached)
+
+
+def load_image(file_name, scale=1, detail=1):
+    # Same as ImageMobject(file_name).scale(scale), but the pixels are first resized to
+    # the size the image occupies at the render quality (times detail) so the camera resamples less
+    path = Path(get_full_raster_image_path(file_name))
+    full_height = Image.open(path).height
+    base_resolution = QUALITIES[DEFAULT_QUALITY]["pixel_height"]
+    height = min(full_height, max(1, round(full_height*scale*config.pixel_height/base_resolution*detail)))
+
+    key = (path, height)
+    if key not in decoded_images:
+        pixels = np.array(resized_image(path, height).convert("RGBA"))
+        # Shared between mobjects, so in-place edits would leak into every copy of the image
+        pixels.flags.writeable = False
+        decoded_images[key] = pixels
+    pixels = decoded_images[key]
+
+    # Keep the size in scene units that the full resolution image would have had
+    image = ImageMobject(pixels, scale_to_resolution=base_resolution*height/full_height)
+    image.pixel_array = pixels
+    return image.scale(scale)
+
+
+def pack_frames(frames, path):
+    # One-time conversion of an image sequence (pixel arrays or ImageMobjects, all the same size)
+    # into a single raw RGBA file: an .npy header giving the frame count and size, then the frames
+    # back to back. Written under a temporary name so concurrent renders never map a partial file
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    first = np.asarray(getattr(frames[0], "pixel_array", frames[0]))
+    temp = path.with_name(f"{path.stem}.{os.getpid()}.tmp.npy")
+    packed = np.lib.format.open_memmap(temp, mode="w+", dtype=np.uint8, shape=(len(frames), *first.shape))
+    for i in range(len(frames)):
+        packed[i] = getattr(frames[i], "pixel_array", frames[i])
+    packed.flush()
+    del packed
+    os.replace(temp, path)
+    return path
+
+
+class FrameStore:
+    # Frames of a file made by pack_frames, memory-mapped read-only: frame i is a view into the
+    # file, so nothing is decoded or copied and render processes share the pages through the OS cache
+    def __init__(self, path):
+        self.path = Path(path)
+        self.pixels = np.load(self.path, mmap_mode="r")
+
+    def __len__(self):
+        return len(self.pixels)
+
+    def __getitem__(self, i):
+        return self.pixels[i]
+
+
+def load_table(file_name, **kwargs):
+    # np.genfromtxt with a binary .npy copy in the cache, keyed by the file and the parsing options
+    # and rebuilt whenever the text file changes
+    source = Path(file_name)
+    digest = hashlib.sha1(repr((str(source.resolve()), sorted(kwargs.items()))).encode()).hexdigest()[:16]
+    cache = Path(config.media_dir) / "cache" / "tables" / f"{source.stem}_{digest}.npy"
+    if cache.exists() and cache.stat().st_mtime >= source.stat().st_mtime:
+        return np.load(cache)
+    table = np.genfromtxt(source, **kwargs)
+    # Written under a temporary name so concurrent renders never load a partial file
+    cache.parent.mkdir(parents=True, exist_ok=True)
+    temp = cache.with_name(f"{cache.stem}.{os.getpid()}.tmp.npy")
+    np.save(temp, table)
+    os.replace(temp, cache)
+    return table
+
+
+def sn_class(type_name):
+    # Legend class of a BTS type: Ia, CC (core collapse), SLSN, nova or other
+    if type_name.lower().startswith("nova"):
+        return "nova"
+    if "SLSN" in type_name:
+        return "SLSN"
+    if "Ia" in type_name:
+        return "Ia"
+    if type_name.startswith("SN I"):
+        return "CC"
+    return "other"
+
+
+def load_catalog(file_name):
+    # Catalog CSV as a dict of column arrays; numeric columns become floats (empty cells NaN),
+    # a date column (YYYY-MM-DD) adds the decimal "year" and a type column adds the legend "class"
+    with open(file_name, newline="") as f:
+        rows = list(csv.DictReader(f))
+    catalog = {}
+    for column in rows[0]:
+        values = [row[column] for row in rows]
+        try:
+            catalog[column] = np.array([float(value or "nan") for value in values])
+        except ValueError:
+            catalog[column] = np.array(values)
+    if "date" in catalog:
+        catalog["year"] = 1970 + catalog["date"].astype("datetime64[D]").astype(float)/365.2425
+    if "type" in catalog:
+        catalog["class"] = np.array([sn_class(type_name) for type_name in catalog["type"]])
+    return catalog
+
+
+def lttb(x, y, n_out):
+    # Largest-triangle-three-buckets downsampling: keeps the end points and, from each bucket
+    # in between, the point making the largest triangle with the previous pick and the next bucket
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return x, y
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    keep = np.empty(n_out, dtype=int)
+    keep[0], keep[-1] = 0, n - 1
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        if i < n_out - 3:
+            next_x, next_y = x[hi:edges[i + 2]].mean(), y[hi:edges[i + 2]].mean()
+        else:
+            next_x, next_y = x[-1], y[-1]
+        prev_x, prev_y = x[keep[i]], y[keep[i]]
+        area = np.abs((prev_x - next_x)*(y[lo:hi] - prev_y) - (prev_x - x[lo:hi])*(next_y - prev_y))
+        keep[i + 1] = lo + np.argmax(area)
+    return x[keep], y[keep]
+
+
+def collect_tex(source_file):
+    # (expression, environment) of every MathTex/Tex a scene file builds from string literals
+    found = set()
+    for node in ast.walk(ast.parse(Path(source_file).read_text())):
+        if not isinstance(node, ast.Call):
+            continue
+        name = getattr(node.func, "id", getattr(node.func, "attr", None))
+        strings = [arg.value for arg in node.args if isinstance(arg, ast.Constant) and isinstance(arg.value, str)]
+        keywords = {k.arg: k.value.value for k in node.keywords if isinstance(k.value, ast.Constant)}
+        if name == "MathTex" and strings:
+            found.add((" ".join(strings).strip(), keywords.get("tex_environment", "align*")))
+        elif name == "Tex" and strings:
+            found.add(("".join(strings).strip(), keywords.get("tex_environment", "center")))
+        elif name == "get_axis_labels":
+            # Axis labels given as strings become MathTex
+            found.update((keywords[k].strip(), "align*") for k in ("x_label", "y_label") if isinstance(keywords.get(k), str))
+    return sorted(found)
+
+
+def precompile_tex(source_file, workers=8):
+    # Compile every TeX string of a scene into manim's tex cache at once, before construct needs them
+    start = time.perf_counter()
+    template = config["tex_template"]
+    jobs = collect_tex(source_file)
+    misses = [job for job in jobs if not generate_tex_file(*job, tex_template=template).with_suffix(".svg").exists()]
+
+    # Concurrent compiles must not clean up each other's intermediate files, so clean up once at the end
+    cleanup = not config["no_latex_cleanup"]
+    with tempconfig({"no_latex_cleanup": True}), ThreadPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(lambda job: tex_to_svg_file(*job, tex_template=template), misses))
+    if cleanup and misses:
+        delete_nonsvg_files()
+
+    logger.info(f"TeX cache: {len(jobs) - len(misses)} hits, {len(misses)} misses "
+                f"compiled in {time.perf_counter() - start:.1f}s")
+    return len(jobs) - len(misses), len(misses)
@@ -0,0 +1,117 @@
+import argparse
+import json
+import multiprocessing
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from manim import tempconfig
+
+from render import QUALITIES
+from scene import CoDEx
+
+# Metrics compared against the baseline, and whether bigger is worse
+METRICS = {"wall_time": True, "fps": False, "peak_rss_mb": True}
+
+
+def count_rendered(renderer):
+    # Wrap the renderer so it counts the plays and frames that were actually rendered
+    renderer.rendered_plays = 0
+    renderer.rendered_frames = 0
+    play, add_frame = renderer.play, renderer.add_frame
+
+    def counting_play(scene, *args, **kwargs):
+        play(scene, *args, **kwargs)
+        if not renderer.skip_animations:
+            renderer.rendered_plays += 1
+
+    def counting_add_frame(frame, num_frames=1):
+        if not renderer.skip_animations:
+            renderer.rendered_frames += num_frames
+        add_frame(frame, num_frames)
+
+    renderer.play, renderer.add_frame = counting_play, counting_add_frame
+
+
+def run_case(section, quality, seed):
+    # Runs in a fresh process so peak RSS belongs to this case alone
+    with tempconfig({"quality": QUALITIES[quality], "disable_caching": True, "verbosity": "WARNING",
+                     "output_file": f"benchmark_{section}_{quality}"}):
+        scene = CoDEx(sections=[section], random_seed=seed)
+        count_rendered(scene.renderer)
+        start = time.perf_counter()
+        scene.render()
+        wall_time = time.perf_counter() - start
+    return {
+        "section": section,
+        "quality": quality,
+        "wall_time": wall_time,
+        "plays": scene.renderer.rendered_plays,
+        "frames": scene.renderer.rendered_frames,
+        "fps": scene.renderer.rendered_frames/wall_time,
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss/1024,
+    }
+
+
+def run_benchmarks(sections, qualities, seed):
+    results = []
+    for quality in qualities:
+        for section in sections:
+            with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as pool:
+                result = pool.submit(run_case, section, quality, seed).result()
+            print(f"{section:>12} -q{quality}: {result['wall_time']:7.1f}s  {result['fps']:6.1f} fps  "
+                  f"{result['plays']:4d} plays  {result['peak_rss_mb']:7.0f} MB")
+            results.append(result)
+    return results
+
+
+def compare(results, baseline, threshold):
+    # Cases whose metrics got worse than the baseline by more than the threshold
+    baseline = {(case["section"], case["quality"]): case for case in baseline}
+    regressions = []
+    for result in results:
+        old = baseline.get((result["section"], result["quality"]))
+        if old is None:
+            continue
+        for metric, bigger_is_worse in METRICS.items():
+            change = (result[metric] - old[metric])/old[metric]
+            if (change if bigger_is_worse else -change) > threshold:
+                regressions.append(f"{result['section']} -q{result['quality']}: {metric} "
+                                   f"{old[metric]:.1f} -> {result[metric]:.1f} ({change:+.0%})")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark rendering each section of CoDEx")
+    parser.add_argument("-s", "--sections", nargs="+", choices=CoDEx.sections, default=list(CoDEx.sections))
+    parser.add_argument("-q", "--qualities", nargs="+", choices=QUALITIES, default=["l", "h"])
+    parser.add_argument("-o", "--output", type=Path, default=Path("benchmarks/results.json"))
+    parser.add_argument("-b", "--baseline", type=Path, default=Path("benchmarks/baseline.json"))
+    parser.add_argument("-t", "--threshold", type=float, default=0.1,
+                        help="relative change that counts as a regression (default: 0.1)")
+    parser.add_argument("--save-baseline", action="store_true", help="store these results as the new baseline")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.sections, args.qualities, args.seed)
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(results, indent=2))
+
+    if args.save_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(results, indent=2))
+        return 0
+    if not args.baseline.exists():
+        print(f"No baseline at {args.baseline}, run with --save-baseline to create one")
+        return 0
+
+    regressions = compare(results, json.loads(args.baseline.read_text()), args.threshold)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,298 @@
+import hashlib
+import os
+from collections import defaultdict
+from pathlib import Path
+
+import numpy as np
+from manim import Camera, MovingCamera, Scene, Transform, config
+from manim.utils.family import extract_mobject_family_members
+
+
+def bounding_box(mobject):
+    points = mobject.points
+    return points[:, 0].min(), points[:, 1].min(), points[:, 0].max(), points[:, 1].max()
+
+
+def overlaps(a, b):
+    return a[0] <= b[2] and a[2] >= b[0] and a[1] <= b[3] and a[3] >= b[1]
+
+
+def resample(pixels, fx, fy):
+    # Bilinear resampling at fx, fy (0 <= f < 1) of a pixel right and down; one pixel smaller each way
+    pixels = pixels.astype(np.float32)
+    pixels = pixels[:, :-1]*(1 - fx) + pixels[:, 1:]*fx
+    return pixels[:-1]*(1 - fy) + pixels[1:]*fy
+
+
+def is_translation(animation):
+    # A transform whose target is its mobject moved along a straight line and unchanged otherwise.
+    # Compares the mobject as it is before the play with the target, so it holds before or after begin
+    if not isinstance(animation, Transform) or animation.path_arc or animation.target_mobject is None:
+        return False
+    start = animation.mobject.family_members_with_points()
+    end = animation.target_mobject.family_members_with_points()
+    if len(start) != len(end):
+        return False
+    shift = None
+    for a, b in zip(start, end):
+        if type(a) is not type(b) or a.points.shape != b.points.shape:
+            return False
+        delta = b.points - a.points
+        shift = delta[0] if shift is None else shift
+        if not np.allclose(delta, shift):
+            return False
+        for attr in ("rgbas", "fill_rgbas", "stroke_rgbas", "stroke_width", "pixel_array"):
+            if hasattr(a, attr) and not np.array_equal(getattr(a, attr), getattr(b, attr)):
+                return False
+    return True
+
+
+def content_hash(mobjects):
+    digest = hashlib.sha1()
+    for mobject in extract_mobject_family_members(mobjects, only_those_with_points=True):
+        digest.update(type(mobject).__name__.encode())
+        for attr in ("points", "rgbas", "fill_rgbas", "stroke_rgbas", "stroke_width", "pixel_array"):
+            if hasattr(mobject, attr):
+                digest.update(np.ascontiguousarray(getattr(mobject, attr)).tobytes())
+    return digest.hexdigest()[:16]
+
+
+class RoundPoints:
+    # Point clouds are drawn as round dots: of the square of pixels cairo would fill around each
+    # point, keep those whose centers are within the dot's radius. Clouds with a `diameter` in scene
+    # units are drawn at that size in this camera's pixels, whatever resolution the cloud was made for
+    def display_point_cloud(self, pmobject, points, rgbas, thickness, pixel_array):
+        if getattr(pmobject, "diameter", None) is not None:
+            thickness = max(1, round(pmobject.diameter*self.pixel_width/self.frame_width))
+        super().display_point_cloud(pmobject, points, rgbas, thickness, pixel_array)
+
+    def get_thickening_nudges(self, thickness):
+        nudges = super().get_thickening_nudges(thickness)
+        center = 0.5 if int(thickness) % 2 == 0 else 0
+        return nudges[((nudges - center)**2).sum(axis=1) <= (int(thickness)/2)**2]
+
+
+class TileCamera(RoundPoints, Camera):
+    # Point cloud thickness is normally rescaled by the camera's size relative to the
+    # output size; tiles are drawn at the output's pixel scale, so leave it as is
+    def adjusted_thickness(self, thickness):
+        return thickness
+
+
+class BackgroundLayer:
+    # Static mobjects rasterized once into square tiles of the world at the output's pixel
+    # scale; tiles are made as the camera reaches them and cached on disk by content and scale
+    def __init__(self, mobjects, tile_size=512):
+        self.mobjects = list(mobjects)
+        self.family = {id(m) for m in extract_mobject_family_members(self.mobjects, only_those_with_points=True)}
+        self.key = content_hash(self.mobjects)
+        self.tile_size = tile_size
+        self.cache_dir = Path(config.media_dir) / "cache" / "tiles"
+        self.tiles = {}
+
+    def tile(self, i, j, pixels_per_unit):
+        # Tile (i, j) covers pixel columns i*tile_size.. and rows j*tile_size.. of the world,
+        # with rows counted downwards from y = 0; fully transparent tiles are None
+        key = (i, j, round(pixels_per_unit, 4))
+        if key not in self.tiles:
+            path = self.cache_dir / f"{self.key}_{key[2]}_{self.tile_size}_{i}_{j}.npy"
+            if path.exists():
+                pixels = np.load(path)
+            else:
+                pixels = self.rasterize(i, j, pixels_per_unit)
+                # Written under a temporary name so concurrent renders never load a partial tile
+                path.parent.mkdir(parents=True, exist_ok=True)
+                temp = path.with_name(f"{path.stem}.{os.getpid()}.tmp.npy")
+                np.save(temp, pixels)
+                os.replace(temp, path)
+            self.tiles[key] = pixels if pixels[..., 3].any() else None
+        return self.tiles[key]
+
+    def rasterize(self, i, j, pixels_per_unit):
+        size = self.tile_size/pixels_per_unit
+        camera = TileCamera(
+            pixel_width=self.tile_size, pixel_height=self.tile_size, frame_width=size, frame_height=size,
+            frame_center=[(i + 0.5)*size, -(j + 0.5)*size, 0], background_opacity=0,
+        )
+        camera.capture_mobjects(self.mobjects)
+        return camera.pixel_array.copy()
+
+
+class GridIndex:
+    # Bounding boxes of mobjects in a uniform grid, keyed by mobject id. Slotted, so manim's
+    # scene hashing doesn't serialize it: the ids change from run to run and would change every hash
+    __slots__ = ("cell_size", "grid", "boxes")
+
+    def __init__(self, cell_size):
+        self.cell_size = cell_size
+        self.grid = defaultdict(set)
+        # id -> (mobject, bounding box); holding the mobject keeps its id from being reused
+        self.boxes = {}
+
+    def __contains__(self, mobject):
+        return id(mobject) in self.boxes
+
+    def cells(self, box):
+        x0, y0, x1, y1 = np.floor(np.array(box)/self.cell_size).astype(int)
+        return [(i, j) for i in range(x0, x1 + 1) for j in range(y0, y1 + 1)]
+
+    def add(self, mobject):
+        box = bounding_box(mobject)
+        self.boxes[id(mobject)] = (mobject, box)
+        for cell in self.cells(box):
+            self.grid[cell].add(id(mobject))
+
+    def remove(self, mobject):
+        _, box = self.boxes.pop(id(mobject), (None, None))
+        if box is not None:
+            for cell in self.cells(box):
+                self.grid[cell].discard(id(mobject))
+
+    def query(self, box):
+        # Ids of the mobjects whose bounding box overlaps box
+        return {
+            key for cell in self.cells(box) for key in self.grid.get(cell, ())
+            if overlaps(self.boxes[key][1], box)
+        }
+
+
+class Sprite:
+    # A mobject that only moves rigidly during a play: rasterized into tiles once, as it was when the
+    # play started, and blitted at its current offset from there
+    def __init__(self, mobject, tile_size=512):
+        self.mobject = mobject
+        self.family = {id(m) for m in mobject.get_family()}
+        self.layer = BackgroundLayer([mobject.copy()], tile_size)
+        self.anchor = mobject.get_center()
+
+    def offset(self):
+        return self.mobject.get_center() - self.anchor
+
+
+class CullingCamera(RoundPoints, MovingCamera):
+    # MovingCamera that only rasterizes mobjects whose bounding box meets the camera frame.
+    # Mobjects registered with add_static are kept in a grid index that is queried each frame,
+    # everything else is tested against the frame directly
+    def __init__(self, *args, cell_size=4, margin=0.5, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.margin = margin
+        self.static = GridIndex(cell_size)
+        self.background_layers = []
+        # Layers and sprites of the current play only, see begin_fast_path
+        self.pan_layers = []
+        self.sprites = []
+
+    def add_static(self, *mobjects):
+        # Mobjects that will not move or change shape again while they are in the scene
+        for mobject in extract_mobject_family_members(mobjects, only_those_with_points=True):
+            self.static.add(mobject)
+
+    def remove_static(self, *mobjects):
+        for mobject in extract_mobject_family_members(mobjects, only_those_with_points=True):
+            self.static.remove(mobject)
+
+    def add_background_layer(self, *mobjects, tile_size=512):
+        # Mobjects that never change again, drawn from pre-rasterized tiles below everything else
+        self.background_layers.append(BackgroundLayer(mobjects, tile_size))
+
+    def frame_box(self):
+        x, y = self.frame_center[:2]
+        half_width = self.frame_width/2 + self.margin
+        half_height = self.frame_height/2 + self.margin
+        return x - half_width, y - half_height, x + half_width, y + half_height
+
+    def begin_fast_path(self, scene, animations):
+        # Draw what a play only translates from tiles: mobjects moved rigidly become sprites, and when
+        # the camera only pans, the mobjects drawn below every moving one become a layer for the play.
+        # Anything else is rasterized as usual
+        counts = defaultdict(int)
+        for animation in animations:
+            for member in animation.mobject.get_family():
+                counts[id(member)] += 1
+        for animation in animations:
+            family = animation.mobject.get_family()
+            if (animation.mobject is not self.frame and is_translation(animation)
+                    and all(counts[id(m)] == 1 and not m.updaters for m in family)):
+                self.sprites.append(Sprite(animation.mobject))
+
+        panning = [animation for animation in animations if animation.mobject is self.frame]
+        if panning and all(is_translation(animation) for animation in panning):
+            # Scene's own split, not MovingCameraScene's, which counts everything as moving while the frame moves
+            members = scene.get_mobject_family_members()
+            static = members[:len(members) - len(Scene.get_moving_mobjects(scene, *animations))]
+            ids = {id(m) for m in static} - set().union(*(layer.family for layer in self.background_layers))
+            static = [m for m in static if len(m.points) and all(id(f) in ids for f in m.get_family())]
+            if static:
+                self.pan_layers.append(BackgroundLayer(static))
+
+    def end_fast_path(self):
+        self.pan_layers.clear()
+        self.sprites.clear()
+
+    def capture_mobjects(self, mobjects, **kwargs):
+        present = {id(m) for m in extract_mobject_family_members(mobjects, only_those_with_points=True)}
+        for layer in self.background_layers + self.pan_layers:
+            if layer.family & present:
+                self.draw_layer(layer)
+        if not self.sprites:
+            return super().capture_mobjects(mobjects, **kwargs)
+
+        # Sprites are blitted in their mobject's place in the drawing order, the rest is rasterized as usual
+        owners = {member: sprite for sprite in self.sprites for member in sprite.family}
+        run, drawn = [], set()
+        for mobject in self.get_mobjects_to_display(mobjects, **kwargs):
+            sprite = owners.get(id(mobject))
+            if sprite is None:
+                run.append(mobject)
+            elif id(sprite) not in drawn:
+                super().capture_mobjects(run, **{**kwargs, "include_submobjects": False})
+                run = []
+                self.draw_layer(sprite.layer, sprite.offset())
+                drawn.add(id(sprite))
+        super().capture_mobjects(run, **{**kwargs, "include_submobjects": False})
+
+    def draw_layer(self, layer, offset=(0, 0)):
+        # Blit the layer's tiles under the camera frame, moved by offset (scene units), at sub-pixel precision
+        size = layer.tile_size
+        pixels_per_unit = self.pixel_width/self.frame_width
+        x = (self.frame_center[0] - offset[0] - self.frame_width/2)*pixels_per_unit
+        y = -(self.frame_center[1] - offset[1] + self.frame_height/2)*pixels_per_unit
+        left, top = int(np.floor(x)), int(np.floor(y))
+        # One pixel more than the frame each way, to resample at the fractional offset
+        right, bottom = left + self.pixel_width + 1, top + self.pixel_height + 1
+
+        tiles = [
+            (i, j, tile) for i in range(left//size, (right - 1)//size + 1)
+            for j in range(top//size, (bottom - 1)//size + 1)
+            if (tile := layer.tile(i, j, pixels_per_unit)) is not None
+        ]
+        if not tiles:
+            return
+        # Only the part of the frame the tiles can reach is resampled and blended
+        c0 = max(min(i for i, _, _ in tiles)*size - left - 1, 0)
+        c1 = min((max(i for i, _, _ in tiles) + 1)*size - left, self.pixel_width)
+        r0 = max(min(j for _, j, _ in tiles)*size - top - 1, 0)
+        r1 = min((max(j for _, j, _ in tiles) + 1)*size - top, self.pixel_height)
+        canvas = np.zeros((r1 - r0 + 1, c1 - c0 + 1, 4), dtype=np.uint8)
+        for i, j, tile in tiles:
+            x0, x1 = max(i*size, left + c0), min((i + 1)*size, left + c1 + 1)
+            y0, y1 = max(j*size, top + r0), min((j + 1)*size, top + r1 + 1)
+            if x0 < x1 and y0 < y1:
+                canvas[y0 - top - r0:y1 - top - r0, x0 - left - c0:x1 - left - c0] = \
+                    tile[y0 - j*size:y1 - j*size, x0 - i*size:x1 - i*size]
+        src = resample(canvas, x - left, y - top)
+        dst = self.pixel_array[r0:r1, c0:c1]
+        # Tiles are premultiplied, like everything cairo draws
+        dst[:] = src + dst*(1 - src[..., 3:]/255)
+
+    def get_mobjects_to_display(self, *args, **kwargs):
+        mobjects = super().get_mobjects_to_display(*args, **kwargs)
+        layered = set().union(*(layer.family for layer in self.background_layers + self.pan_layers))
+        mobjects = [mobject for mobject in mobjects if id(mobject) not in layered]
+        frame = self.frame_box()
+        visible_static = self.static.query(frame)
+        return [
+            mobject for mobject in mobjects
+            if (id(mobject) in visible_static if mobject in self.static
+                else len(mobject.points) == 0 or overlaps(bounding_box(mobject), frame))
+        ]
@@ -0,0 +1,174 @@
+import hashlib
+import json
+import os
+import random
+import sys
+from collections import Counter
+from pathlib import Path
+
+import numpy as np
+from manim import config, logger
+from manim.utils.family import extract_mobject_family_members
+
+from camera import content_hash
+
+
+def source_digest(scene):
+    # The code of every module next to the scene's; a checkpoint of other code is not resumed
+    digest = hashlib.sha1()
+    for path in sorted(Path(sys.modules[type(scene).__module__].__file__).parent.glob("*.py")):
+        digest.update(path.name.encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def file_record(path):
+    if path is None:
+        return None
+    stat = os.stat(path)
+    return {"path": str(path), "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def unchanged(record):
+    # A partial movie is reused only if it is still the file the checkpoint saw
+    if record is None:
+        return True
+    try:
+        return file_record(record["path"]) == record
+    except OSError:
+        return False
+
+
+def mobject_record(scene):
+    members = extract_mobject_family_members(scene.mobjects)
+    return {
+        "count": len(members),
+        "types": dict(Counter(type(mobject).__name__ for mobject in members)),
+        "digest": content_hash(scene.mobjects),
+    }
+
+
+class Checkpoints:
+    # Saves a render's progress at every section boundary, and every `every` plays if given, so an
+    # interrupted render can resume: the plays before the checkpoint are skipped, which only replays
+    # construct to rebuild the scene, and the partial movies they wrote are reused. A checkpoint holds
+    # the partial movies written so far, the camera frame, the random states and a record of the live
+    # mobjects; once the render is done it marks the movie as finished
+    def __init__(self, scene, every=None, resume=False):
+        self.scene = scene
+        self.every = every
+        self.settings = {
+            "scene": type(scene).__name__,
+            "output_file": config.output_file,
+            "resolution": [config.pixel_width, config.pixel_height],
+            "frame_rate": config.frame_rate,
+            "seed": scene.random_seed,
+            "sections": getattr(scene, "selected_sections", None),
+            "detail": getattr(scene, "detail", 1),
+            "disable_caching": config.disable_caching,
+            "source": source_digest(scene),
+        }
+        name = config.output_file or type(scene).__name__
+        self.path = Path(config.media_dir) / "checkpoints" / f"{name}_{config.pixel_height}p{config.frame_rate}.json"
+        self.saved = None
+        self.sections = 0
+        self.checkpoint = self.load() if resume else None
+        scene.renderer.play = self.checkpointed_play(scene.renderer.play)
+
+    def load(self):
+        if not self.path.exists():
+            logger.info(f"No checkpoint at {self.path}, rendering from the start")
+            return None
+        checkpoint = json.loads(self.path.read_text())
+        if checkpoint["settings"] != self.settings:
+            logger.warning(f"{self.path} is for other settings or code, rendering from the start")
+            return None
+        files = checkpoint["movie_files"] if checkpoint.get("finished") else checkpoint["partial_movie_files"]
+        if not all(unchanged(record) for record in files):
+            logger.warning(f"Movie files of {self.path} were changed or removed, rendering from the start")
+            return None
+        return checkpoint
+
+    @property
+    def finished(self):
+        # Movie files of a render that already completed, which a resumed render returns as they are
+        if self.checkpoint and self.checkpoint.get("finished"):
+            return [record["path"] for record in self.checkpoint["movie_files"]]
+
+    def checkpointed_play(self, play):
+        def wrapper(scene, *args, **kwargs):
+            index = scene.renderer.num_plays
+            sections = len(scene.renderer.file_writer.sections)
+            if self.checkpoint and index < self.checkpoint["plays"]:
+                self.skip(play, scene, *args, **kwargs)
+            else:
+                if self.checkpoint and index == self.checkpoint["plays"]:
+                    self.restore(scene)
+                elif index and index != self.saved and (
+                        sections != self.sections or (self.every and index % self.every == 0)):
+                    self.save(scene)
+                play(scene, *args, **kwargs)
+            self.sections = sections
+        return wrapper
+
+    def skip(self, play, scene, *args, **kwargs):
+        # Run the play as a skipped one, then put back the partial movie it wrote last time
+        renderer, file_writer = scene.renderer, scene.renderer.file_writer
+        index = renderer.num_plays
+        skipping = renderer._original_skipping_status
+        renderer._original_skipping_status = True
+        try:
+            play(scene, *args, **kwargs)
+        finally:
+            renderer._original_skipping_status = skipping
+        if file_writer.sections[-1].name != self.checkpoint["sections"][index]:
+            raise RuntimeError(f"Play {index} is now in section {file_writer.sections[-1].name} instead of "
+                               f"{self.checkpoint['sections'][index]}; render again without --resume")
+        if len(file_writer.partial_movie_files) == index + 1:
+            record = self.checkpoint["partial_movie_files"][index]
+            file_writer.partial_movie_files[-1] = file_writer.sections[-1].partial_movie_files[-1] = \
+                record and record["path"]
+
+    def restore(self, scene):
+        checkpoint = self.checkpoint
+        if mobject_record(scene) != checkpoint["mobjects"]:
+            raise RuntimeError(f"The scene rebuilt up to play {checkpoint['plays']} differs from the checkpoint's; "
+                               "render again without --resume")
+        scene.camera.frame.points = np.array(checkpoint["frame"])
+        name, keys, position, has_gauss, cached_gaussian = checkpoint["numpy_random_state"]
+        np.random.set_state((name, np.array(keys, dtype=np.uint32), position, has_gauss, cached_gaussian))
+        version, state, gauss = checkpoint["random_state"]
+        random.setstate((version, tuple(state), gauss))
+        logger.info(f"Resumed from {self.path} at play {checkpoint['plays']}")
+        self.saved = checkpoint["plays"]
+
+    def save(self, scene):
+        renderer, file_writer = scene.renderer, scene.renderer.file_writer
+        index = renderer.num_plays
+        # Nothing to resume from without partial movies, e.g. in a dry run
+        if len(file_writer.partial_movie_files) < index:
+            return
+        # Every listed partial movie is complete: manim joins its encoder thread at the end of each play
+        name, keys, position, has_gauss, cached_gaussian = np.random.get_state()
+        self.write({
+            "settings": self.settings,
+            "plays": index,
+            "sections": [section.name for section in file_writer.sections for _ in section.partial_movie_files],
+            "partial_movie_files": [file_record(path) for path in file_writer.partial_movie_files[:index]],
+            "frame": scene.camera.frame.points.tolist(),
+            "numpy_random_state": [name, keys.tolist(), position, has_gauss, cached_gaussian],
+            "random_state": random.getstate(),
+            "mobjects": mobject_record(scene),
+        })
+        self.saved = index
+
+    def finish(self, movie_files):
+        self.write({"settings": self.settings, "finished": True,
+                    "movie_files": [file_record(path) for path in movie_files]})
+
+    def write(self, checkpoint):
+        # Written under a temporary name, so an interruption never leaves half a checkpoint
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp = self.path.with_name(f"{self.path.stem}.{os.getpid()}.tmp")
+        temp.write_text(json.dumps(checkpoint))
+        os.replace(temp, self.path)
@@ -0,0 +1,127 @@
+import argparse
+import json
+import multiprocessing
+import os
+import shutil
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+from manim import tempconfig
+
+from render import QUALITIES
+from scene import CoDEx
+
+
+def sample_frames(renderer, interval, output_dir):
+    # Wrap the renderer so it saves the frame shown every `interval` seconds, and the last frame
+    output_dir.mkdir(parents=True, exist_ok=True)
+    frame_rate = renderer.camera.frame_rate
+    step = interval*frame_rate
+    state = {"count": 0, "next": 0, "last": None}
+    add_frame = renderer.add_frame
+
+    def sampling_add_frame(frame, num_frames=1):
+        if not renderer.skip_animations:
+            state["count"] += num_frames
+            while round(state["next"]*step) < state["count"]:
+                Image.fromarray(frame[..., :3]).save(output_dir / f"t{state['next']*interval:07.2f}.png")
+                state["next"] += 1
+            state["last"] = frame
+        add_frame(frame, num_frames)
+
+    renderer.add_frame = sampling_add_frame
+    return state
+
+
+def run_case(section, quality, seed, interval, output_dir):
+    # Runs in a fresh process, like a normal render of the one section. Frames are sampled as they are
+    # rendered, so no movie is written: the sections would share one partial movie directory
+    with tempconfig({"quality": QUALITIES[quality], "disable_caching": True, "verbosity": "WARNING",
+                     "write_to_movie": False}):
+        scene = CoDEx(sections=[section], random_seed=seed)
+        state = sample_frames(scene.renderer, interval, output_dir)
+        scene.render()
+        frame_rate = scene.renderer.camera.frame_rate
+    if state["last"] is not None:
+        Image.fromarray(state["last"][..., :3]).save(output_dir / "end.png")
+    (output_dir / "frames.json").write_text(json.dumps({"frames": state["count"], "frame_rate": frame_rate}))
+    return section
+
+
+def luminance(file_name):
+    rgb = np.asarray(Image.open(file_name).convert("RGB"), dtype=float)
+    luma = rgb @ [0.2126, 0.7152, 0.0722]
+    # 3x3 box blur, so antialiasing and sub-pixel shifts don't count as differences
+    padded = np.pad(luma, 1, mode="edge")
+    return sum(padded[i:i + luma.shape[0], j:j + luma.shape[1]] for i in range(3) for j in range(3))/9
+
+
+def perceptual_difference(a, b, pixel_threshold=16):
+    # Share of pixels whose blurred luminance differs by more than pixel_threshold (out of 255)
+    a, b = luminance(a), luminance(b)
+    if a.shape != b.shape:
+        return 1.0
+    return float(np.mean(np.abs(a - b) > pixel_threshold))
+
+
+def compare(frames_dir, golden_dir, tolerance):
+    # Differences between a section's sampled frames and its golden frames
+    problems = []
+    frames, golden = json.loads((frames_dir / "frames.json").read_text()), json.loads((golden_dir / "frames.json").read_text())
+    if frames != golden:
+        problems.append(f"length {golden['frames']} frames at {golden['frame_rate']} fps -> "
+                        f"{frames['frames']} frames at {frames['frame_rate']} fps")
+    names = sorted({path.name for path in golden_dir.glob("*.png")} | {path.name for path in frames_dir.glob("*.png")})
+    for name in names:
+        if not (frames_dir / name).exists() or not (golden_dir / name).exists():
+            problems.append(f"{name} only in {'golden' if (golden_dir / name).exists() else 'new'} frames")
+            continue
+        difference = perceptual_difference(frames_dir / name, golden_dir / name)
+        if difference > tolerance:
+            problems.append(f"{name} differs in {difference:.2%} of pixels")
+    return problems
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check that CoDEx still renders the same frames as the golden ones")
+    parser.add_argument("-s", "--sections", nargs="+", choices=CoDEx.sections, default=list(CoDEx.sections))
+    parser.add_argument("-q", "--quality", choices=QUALITIES, default="l")
+    parser.add_argument("-i", "--interval", type=float, default=1.0, help="seconds between sampled frames (default: 1)")
+    parser.add_argument("-t", "--tolerance", type=float, default=0.005,
+                        help="share of pixels allowed to differ visibly in a frame (default: 0.005)")
+    parser.add_argument("-g", "--golden", type=Path, default=Path("benchmarks/golden"))
+    parser.add_argument("-o", "--output", type=Path, default=Path("benchmarks/frames"))
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count())
+    parser.add_argument("--update", action="store_true", help="store these frames as the new golden frames")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    for section in args.sections:
+        shutil.rmtree(args.output / args.quality / section, ignore_errors=True)
+    with ProcessPoolExecutor(max_workers=args.jobs, mp_context=multiprocessing.get_context("spawn")) as pool:
+        list(pool.map(run_case, args.sections, [args.quality]*len(args.sections), [args.seed]*len(args.sections),
+                      [args.interval]*len(args.sections), [args.output / args.quality / s for s in args.sections]))
+
+    failed = False
+    for section in args.sections:
+        frames_dir, golden_dir = args.output / args.quality / section, args.golden / args.quality / section
+        if args.update:
+            shutil.rmtree(golden_dir, ignore_errors=True)
+            shutil.copytree(frames_dir, golden_dir)
+            continue
+        if not golden_dir.exists():
+            print(f"{section:>12}: no golden frames at {golden_dir}, run with --update to create them")
+            continue
+        problems = compare(frames_dir, golden_dir, args.tolerance)
+        print(f"{section:>12}: {'ok' if not problems else 'CHANGED'}")
+        for problem in problems:
+            print(f"{'':>14}{problem}")
+        failed = failed or bool(problems)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
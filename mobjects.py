@@ -0,0 +1,417 @@
+import hashlib
+from pathlib import Path
+
+from manim import *
+from manim.utils.images import get_full_raster_image_path
+from PIL import Image, ImageDraw
+
+from assets import FrameStore, pack_frames
+from camera import TileCamera
+
+
+class Starfield(Mobject):
+    # Stars kept as arrays and drawn as a few point clouds (one per pixel size)
+    # instead of one Dot per star, so the camera rasterizes them in one vectorized pass
+    def __init__(self, points, radii, color=WHITE, twinkle=0, twinkle_period=3, rng=np.random, **kwargs):
+        super().__init__(**kwargs)
+        points = np.asarray(points, dtype=float)
+        radii = np.abs(np.asarray(radii, dtype=float))
+
+        # Point clouds are drawn as dots of whole pixels (round with RoundPoints cameras), so bin stars by diameter in pixels
+        px_per_unit = config.pixel_width / config.frame_width
+        diameters = np.maximum(np.rint(2*radii*px_per_unit), 1).astype(int)
+
+        self.twinkle = twinkle
+        self.twinkle_period = twinkle_period
+        self.elapsed = 0
+        for diameter in np.unique(diameters):
+            cloud = PMobject(stroke_width=diameter)
+            # Size in scene units, which RoundPoints cameras convert to their own pixels
+            cloud.diameter = diameter/px_per_unit
+            cloud.add_points(points[diameters == diameter], color=color)
+            cloud.base_rgbs = cloud.rgbas[:, :3].copy()
+            cloud.phases = rng.uniform(0, TAU, len(cloud.points))
+            self.add(cloud)
+
+        if twinkle > 0:
+            self.add_updater(lambda m, dt: m.twinkle_stars(dt))
+
+    def twinkle_stars(self, dt):
+        # Modulate brightness rather than alpha; the video writer drops the alpha channel
+        self.elapsed += dt
+        for cloud in self.submobjects:
+            wave = 0.5 + 0.5*np.sin(TAU*self.elapsed/self.twinkle_period + cloud.phases)
+            cloud.rgbas[:, :3] = cloud.base_rgbs * (1 - self.twinkle*wave)[:, None]
+        return self
+
+
+class ImageSequence(ImageMobject):
+    # An ImageMobject that shows one frame of an image sequence at a time; frames can be any
+    # indexable of ImageMobjects or pixel arrays, e.g. a FrameStore
+    def __init__(self, frames, **kwargs):
+        self.frames = frames
+        self.frame_index = 0
+        super().__init__(getattr(frames[0], "pixel_array", frames[0]), **kwargs)
+
+    def set_frame(self, i):
+        if i != self.frame_index:
+            self.pixel_array = getattr(self.frames[i], "pixel_array", self.frames[i])
+            self.frame_index = i
+        return self
+
+    def __deepcopy__(self, memo):
+        # Copies made by animations share the frame source instead of duplicating it
+        memo[id(self.frames)] = self.frames
+        return super().__deepcopy__(memo)
+
+
+class Flipbook(Animation):
+    # Moves an ImageSequence by `shift` while flipping through its frames in one animation;
+    # frame i is shown from progress rate_func(alpha) = frame_starts[i] on (evenly spaced by default)
+    def __init__(self, sequence, shift=ORIGIN, frame_starts=None, **kwargs):
+        if frame_starts is None:
+            frame_starts = np.linspace(0, 1, len(sequence.frames), endpoint=False)
+        self.shift = np.asarray(shift, dtype=float)
+        self.frame_starts = np.asarray(frame_starts)
+        super().__init__(sequence, **kwargs)
+
+    def begin(self):
+        self.start_center = self.mobject.get_center()
+        super().begin()
+
+    def interpolate_mobject(self, alpha):
+        # Overriding interpolate_mobject skips Animation's own rate_func, so apply it here
+        alpha = self.rate_func(alpha)
+        self.mobject.set_frame(int(np.searchsorted(self.frame_starts, alpha, side="right")) - 1)
+        self.mobject.move_to(self.start_center + alpha*self.shift)
+
+
+class ParticleSystem(PMobject):
+    # Particles travelling in straight lines from their start points to their targets, each
+    # arriving after its own travel time; all are drawn as round pixel disks in one point cloud
+    def __init__(self, starts, targets, travel_times, radius=0.025, color=WHITE, **kwargs):
+        super().__init__(stroke_width=1, **kwargs)
+        self.starts = np.asarray(starts, dtype=float)
+        self.targets = np.broadcast_to(np.asarray(targets, dtype=float), self.starts.shape).copy()
+        self.travel_times = np.asarray(travel_times, dtype=float)
+
+        # Pixel offsets covering a disk of the given radius
+        pixel = config.frame_width / config.pixel_width
+        r = max(radius/pixel, 0.5)
+        grid = np.arange(-np.ceil(r), np.ceil(r) + 1)
+        gx, gy = np.meshgrid(grid, grid)
+        inside = gx**2 + gy**2 <= r**2
+        self.disk = np.column_stack([gx[inside], gy[inside], np.zeros(inside.sum())])*pixel
+
+        self.set_time(0)
+        self.rgbas = np.repeat([color_to_rgba(color)], len(self.points), axis=0)
+
+    def set_time(self, t):
+        progress = np.clip(t/self.travel_times, 0, 1)[:, None]
+        centers = self.starts + progress*(self.targets - self.starts)
+        self.points = (centers[:, None, :] + self.disk[None, :, :]).reshape(-1, 3)
+        return self
+
+
+class MoveParticles(Animation):
+    # Advances every particle of a ParticleSystem in one vectorized update per frame
+    def __init__(self, particles, **kwargs):
+        kwargs.setdefault("run_time", np.max(particles.travel_times))
+        kwargs.setdefault("rate_func", linear)
+        super().__init__(particles, **kwargs)
+
+    def interpolate_mobject(self, alpha):
+        self.mobject.set_time(alpha*self.run_time)
+
+
+class Keyframes(Animation):
+    # Takes a mobject through a track of keys (time, state, rate_func) in one animation: between keys
+    # it moves from the previous key's state to the next with that key's rate function. States are
+    # functions applied to a copy of the previous state, or None to hold still, and are made up front
+    def __init__(self, mobject, keys, run_time, **kwargs):
+        self.times = [0]
+        self.states = [mobject.copy()]
+        self.rate_funcs = []
+        for time, state, rate_func in keys:
+            target = self.states[-1].copy()
+            if state is not None:
+                state(target)
+            self.times.append(time)
+            self.states.append(target)
+            self.rate_funcs.append(rate_func)
+        self.holds = [state is None for _, state, _ in keys]
+        self.families = [state.family_members_with_points() for state in self.states]
+        self.segment = None
+        kwargs.setdefault("rate_func", linear)
+        super().__init__(mobject, run_time=run_time, **kwargs)
+
+    def interpolate_mobject(self, alpha):
+        t = alpha*self.run_time
+        i = min(max(int(np.searchsorted(self.times, t, side="right")) - 1, 0), len(self.rate_funcs) - 1)
+        # Holds only need their state set once
+        if self.holds[i] and self.segment == i:
+            return
+        self.segment = i
+        span = self.times[i + 1] - self.times[i]
+        progress = self.rate_funcs[i](np.clip((t - self.times[i])/span, 0, 1)) if span > 0 else 1
+        for submobject, start, end in zip(self.mobject.family_members_with_points(),
+                                          self.families[i], self.families[i + 1]):
+            submobject.interpolate(start, end, progress)
+
+
+class Timeline:
+    # Keyframe tracks of several mobjects, compiled into one Keyframes animation per mobject that all
+    # last the whole timeline, so a chain of short moves and colour changes plays as a single play
+    def __init__(self):
+        self.tracks = {}
+        self.time = 0
+
+    def key(self, mobject, time, state=None, rate_func=smooth):
+        self.tracks.setdefault(id(mobject), (mobject, []))[1].append((time, state, rate_func))
+        return self
+
+    def change(self, mobject, start, end, state, rate_func=smooth):
+        # Hold still until start, then change to state by end
+        return self.key(mobject, start).key(mobject, end, state, rate_func)
+
+    def then(self, run_time, *changes, rate_func=smooth):
+        # Next step of the timeline: every (mobject, state) changes at once, after the previous step
+        for mobject, state in changes:
+            self.change(mobject, self.time, self.time + run_time, state, rate_func)
+        self.time += run_time
+        return self
+
+    @property
+    def run_time(self):
+        return max(time for _, keys in self.tracks.values() for time, _, _ in keys)
+
+    def animations(self):
+        return [Keyframes(mobject, sorted(keys, key=lambda key: key[0]), self.run_time)
+                for mobject, keys in self.tracks.values()]
+
+
+# J2000 equatorial to galactic rotation
+EQUATORIAL_TO_GALACTIC = np.array([
+    [-0.0548755604, -0.8734370902, -0.4838350155],
+    [+0.4941094279, -0.4448296300, +0.7469822445],
+    [-0.8676661490, -0.1980763734, +0.4559837762],
+])
+
+
+def galactic_mollweide(ra, dec):
+    # Galactic Mollweide projection of equatorial coordinates (degrees), galactic centre in
+    # the middle and longitude increasing to the left; x in [-1, 1], y in [-1/2, 1/2]
+    ra, dec = np.radians(ra), np.radians(dec)
+    xyz = EQUATORIAL_TO_GALACTIC @ np.array([np.cos(dec)*np.cos(ra), np.cos(dec)*np.sin(ra), np.sin(dec)])
+    lon = np.arctan2(xyz[1], xyz[0])
+    lat = np.arcsin(np.clip(xyz[2], -1, 1))
+
+    # Solve 2t + sin(2t) = pi*sin(lat) for the auxiliary angle t by Newton's method
+    theta = lat.copy()
+    for _ in range(20):
+        slope = 2 + 2*np.cos(2*theta)
+        step = (2*theta + np.sin(2*theta) - PI*np.sin(lat))/np.where(slope > 1e-9, slope, 1)
+        theta = np.where(slope > 1e-9, theta - step, theta)
+    return -lon/PI*np.cos(theta), np.sin(theta)/2
+
+
+class SkyMapFrames:
+    # Frames of an all-sky map of a supernova catalog: frame i shows everything discovered
+    # by dates[i] (decimal years), coloured by class and sized by peak brightness, rasterized
+    # at the output resolution. Frames are drawn on demand, adding to the previous one when moving forward
+    def __init__(self, catalog, dates, width, background=None, colors=None):
+        colors = colors or {"Ia": RED, "CC": BLUE_C, "SLSN": GREEN}
+        px_per_unit = config.pixel_width/config.frame_width
+        self.width = max(2, round(width*px_per_unit))
+        self.height = self.width//2
+        self.dates = np.asarray(dates, dtype=float)
+
+        keep = np.isin(catalog["class"], list(colors))
+        order = np.argsort(catalog["year"][keep])
+        sne = {key: np.asarray(value)[keep][order] for key, value in catalog.items()}
+        self.years = sne["year"]
+
+        x, y = galactic_mollweide(sne["ra"], sne["dec"])
+        self.cols = np.clip(((x + 1)/2*self.width).astype(int), 0, self.width - 1)
+        self.rows = np.clip(((0.5 - y)*self.height).astype(int), 0, self.height - 1)
+        self.rgbas = np.array([color_to_int_rgba(colors[c]) for c in sne["class"]], dtype=np.uint8).reshape(-1, 4)
+        # Brighter supernovae get bigger points; radii are in pixels at 1080p, scaled to the output
+        mags = np.nan_to_num(sne["peak_mag"], nan=19.5)
+        self.radii = np.rint(np.interp(mags, [16, 19.5], [3, 1])*px_per_unit*config.frame_height/1080).astype(int)
+
+        if background is None:
+            self.base = np.zeros((self.height, self.width, 4), dtype=np.uint8)
+            self.base[..., 3] = 255
+        else:
+            image = Image.open(get_full_raster_image_path(background)).convert("RGBA")
+            self.base = np.array(image.resize((self.width, self.height), Image.LANCZOS))
+        self.drawn_date, self.drawn_count, self.pixels = -np.inf, 0, self.base.copy()
+
+    def __len__(self):
+        return len(self.dates)
+
+    def __getitem__(self, i):
+        date = self.dates[i]
+        if date < self.drawn_date:
+            self.drawn_count, self.pixels = 0, self.base.copy()
+        count = np.searchsorted(self.years, date, side="right")
+        self.draw(self.drawn_count, count)
+        self.drawn_date, self.drawn_count = date, count
+        return ImageMobject(self.pixels, scale_to_resolution=config.pixel_height)
+
+    def draw(self, start, stop):
+        for radius in np.unique(self.radii[start:stop]):
+            sne = start + np.flatnonzero(self.radii[start:stop] == radius)
+            grid = np.arange(-radius, radius + 1)
+            dx, dy = np.meshgrid(grid, grid)
+            inside = dx**2 + dy**2 <= radius**2 + radius
+            rows = np.clip(self.rows[sne, None] + dy[inside], 0, self.height - 1)
+            cols = np.clip(self.cols[sne, None] + dx[inside], 0, self.width - 1)
+            self.pixels[rows, cols] = self.rgbas[sne, None]
+
+
+class SkyMap(ImageSequence):
+    # Data-driven replacement for a pre-rendered sky-map image sequence, see SkyMapFrames. The
+    # frames are drawn once per catalog, dates and resolution and packed into a memory-mapped FrameStore.
+    # Packed frames take gigabytes at high resolutions, so packs of any other catalog are deleted; packs of
+    # this catalog at other resolutions or dates (drafts, test renders) stay, as redrawing them costs minutes
+    def __init__(self, catalog, dates, width=7.4, background=None, colors=None, **kwargs):
+        source = hashlib.sha1()
+        for column in sorted(catalog):
+            source.update(column.encode())
+            source.update(np.ascontiguousarray(catalog[column]).tobytes())
+        key = hashlib.sha1(repr((width, colors, config.pixel_width, config.frame_width, config.frame_height)).encode())
+        key.update(np.asarray(dates, dtype=float).tobytes())
+        if background is not None:
+            key.update(Path(get_full_raster_image_path(background)).read_bytes())
+        cache_dir = Path(config.media_dir) / "cache" / "frames"
+        path = cache_dir / f"skymap_{source.hexdigest()[:16]}_{key.hexdigest()[:16]}.npy"
+        if not path.exists():
+            # Processes still mapping an evicted file keep reading it until they unmap it
+            for old in cache_dir.glob(f"skymap_{'?'*16}_{'?'*16}.npy"):
+                if not old.name.startswith(f"skymap_{source.hexdigest()[:16]}_"):
+                    old.unlink(missing_ok=True)
+            pack_frames(SkyMapFrames(catalog, dates, width, background, colors), path)
+        super().__init__(FrameStore(path), scale_to_resolution=config.pixel_height, **kwargs)
+
+
+def premultiplied_to_straight(pixels):
+    alpha = pixels[..., 3:]
+    rgb = pixels[..., :3]*255/np.maximum(alpha, 1)
+    return np.concatenate([rgb, alpha], axis=-1).round().astype(np.uint8)
+
+
+class ScatterPlot(ImageMobject):
+    # A catalog scatter plot rasterized once, at the output resolution, into stacked layers:
+    # axes, axis labels, the whole sample in gray, then one layer per class drawn with the
+    # legend's markers. Layers are cached on disk by data and size and shown one at a time
+    # with RevealLayer, so the scene composites a single image however many layers are shown
+    markers = {"Ia": ("dot", RED), "CC": ("cross", BLUE_E), "SLSN": ("diamond", GREEN), "nova": ("hexagon", YELLOW)}
+
+    def __init__(self, catalog, x, y, x_range, y_range, width=7, height=4.5, x_label="", y_label="",
+                 flip_y=False, classes=("Ia", "CC", "SLSN", "nova"), **kwargs):
+        self.x_range, self.y_range, self.flip_y = x_range, y_range, flip_y
+        axes = Axes(x_range=x_range, y_range=y_range, x_length=width, y_length=height, tips=False,
+                    axis_config={"color": WHITE, "stroke_width": 2})
+        # Tick numbers; with flip_y the axis is of -y, so brighter (more negative) magnitudes are up
+        numbers = VGroup(
+            *(Text(f"{value:g}", font_size=20).next_to(axes.c2p(value, y_range[0]), DOWN)
+              for value in np.arange(x_range[0], x_range[1] + x_range[2]/2, x_range[2])),
+            *(Text(f"{-value if flip_y else value:g}", font_size=20).next_to(axes.c2p(x_range[0], value), LEFT)
+              for value in np.arange(y_range[0], y_range[1] + y_range[2]/2, y_range[2])),
+        )
+        labels = VGroup(
+            Text(x_label, font_size=24).next_to(axes.x_axis, DOWN, buff=0.6),
+            Text(y_label, font_size=24).rotate(PI/2).next_to(axes.y_axis, LEFT, buff=0.7),
+        )
+        frame = VGroup(axes, numbers, labels)
+
+        # World to pixel mapping of the rasterized frame
+        self.ppu = config.pixel_width/config.frame_width
+        self.left, self.top = frame.get_left()[0] - 0.1, frame.get_top()[1] + 0.1
+        self.size = (round((frame.get_width() + 0.2)*self.ppu), round((frame.get_height() + 0.2)*self.ppu))
+        self.origin, self.corner = axes.c2p(x_range[0], y_range[0]), axes.c2p(x_range[1], y_range[1])
+
+        xs = np.asarray(catalog[x], dtype=float)
+        ys = np.asarray(catalog[y], dtype=float)*(-1 if flip_y else 1)
+        inside = (xs >= x_range[0]) & (xs <= x_range[1]) & (ys >= y_range[0]) & (ys <= y_range[1])
+        xs, ys, kinds = xs[inside], ys[inside], np.asarray(catalog["class"])[inside]
+
+        key = hashlib.sha1(repr((x_range, y_range, width, height, x_label, y_label, flip_y, classes, self.size)).encode())
+        for column in (xs, ys, kinds):
+            key.update(np.ascontiguousarray(column).tobytes())
+        path = Path(config.media_dir) / "cache" / "scatter" / f"{key.hexdigest()[:16]}.npz"
+        if path.exists():
+            self.layers = np.load(path)["layers"]
+        else:
+            self.layers = np.stack([
+                self.rasterize(axes), self.rasterize(VGroup(numbers, labels)),
+                self.draw_markers(xs, ys, "dot", GRAY, radius=2),
+                *(self.draw_markers(xs[kinds == c], ys[kinds == c], *self.markers[c]) for c in classes),
+            ])
+            path.parent.mkdir(parents=True, exist_ok=True)
+            np.savez_compressed(path, layers=self.layers)
+
+        # Number of layers revealed so far and their premultiplied composite
+        self.shown = 0
+        self.composite = np.zeros(self.layers.shape[1:], dtype=np.float32)
+        super().__init__(premultiplied_to_straight(self.composite), scale_to_resolution=config.pixel_height, **kwargs)
+
+    def rasterize(self, mobject):
+        width, height = self.size[0]/self.ppu, self.size[1]/self.ppu
+        camera = TileCamera(
+            pixel_width=self.size[0], pixel_height=self.size[1], frame_width=width, frame_height=height,
+            frame_center=[self.left + width/2, self.top - height/2, 0], background_opacity=0,
+        )
+        camera.capture_mobjects([mobject])
+        return camera.pixel_array.copy()
+
+    def draw_markers(self, xs, ys, shape, color, radius=5):
+        # Markers are drawn at their on-screen pixel size; radii are in pixels at 1080p
+        r = radius*config.pixel_height/1080
+        cols = (self.origin[0] + (xs - self.x_range[0])/(self.x_range[1] - self.x_range[0])*(self.corner[0] - self.origin[0]) - self.left)*self.ppu
+        rows = (self.top - self.origin[1] - (ys - self.y_range[0])/(self.y_range[1] - self.y_range[0])*(self.corner[1] - self.origin[1]))*self.ppu
+        image = Image.new("RGBA", self.size)
+        draw = ImageDraw.Draw(image)
+        fill = tuple(color_to_int_rgba(color))
+        for col, row in zip(cols, rows):
+            if shape == "dot":
+                draw.ellipse([col - r, row - r, col + r, row + r], fill=fill)
+            elif shape == "cross":
+                width = max(1, round(r/2))
+                draw.line([col - r, row - r, col + r, row + r], fill=fill, width=width)
+                draw.line([col - r, row + r, col + r, row - r], fill=fill, width=width)
+            elif shape == "diamond":
+                draw.regular_polygon((col, row, r), 4, rotation=45, fill=fill)
+            elif shape == "hexagon":
+                draw.regular_polygon((col, row, r), 6, fill=fill)
+        pixels = np.array(image)
+        pixels[..., :3] = pixels[..., :3].astype(np.uint16)*pixels[..., 3:]//255
+        return pixels
+
+    def __deepcopy__(self, memo):
+        # Copies made by animations share the rasterized layers
+        memo[id(self.layers)] = self.layers
+        return super().__deepcopy__(memo)
+
+
+class RevealLayer(Animation):
+    # Fades the next layer of a ScatterPlot in over the layers already shown
+    def __init__(self, plot, **kwargs):
+        super().__init__(plot, **kwargs)
+
+    def begin(self):
+        self.layer = self.mobject.layers[self.mobject.shown].astype(np.float32)
+        self.below = self.mobject.composite
+        super().begin()
+
+    def interpolate_mobject(self, alpha):
+        # Overriding interpolate_mobject skips Animation's own rate_func (smooth, like FadeIn), so apply it here
+        alpha = self.rate_func(alpha)
+        pixels = self.layer*alpha + self.below*(1 - self.layer[..., 3:]*alpha/255)
+        self.mobject.pixel_array = premultiplied_to_straight(pixels)
+
+    def finish(self):
+        super().finish()
+        self.mobject.composite = self.layer + self.below*(1 - self.layer[..., 3:]/255)
+        self.mobject.shown += 1
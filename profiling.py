@@ -0,0 +1,87 @@
+import json
+import resource
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+
+def current_rss_mb():
+    # Resident memory right now where /proc is available, peak resident memory elsewhere
+    try:
+        pages = int(Path("/proc/self/statm").read_text().split()[1])
+        return pages*resource.getpagesize()/2**20
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss/1024
+
+
+class PlayTracer:
+    # Records every play and wait a scene issues, with where the time went, as a Chrome
+    # trace (open it in chrome://tracing or ui.perfetto.dev)
+    def __init__(self, scene):
+        self.scene = scene
+        self.scene_file = sys.modules[type(scene).__module__].__file__
+        self.events = []
+        self.start = time.perf_counter()
+        self.phases = Counter()
+        self.wrap(scene.renderer, "play", self.traced_play)
+        self.wrap(scene, "update_to_time", self.timed("interpolation"))
+        self.wrap(scene.renderer, "update_frame", self.timed("rasterization"))
+        self.wrap(scene.renderer.file_writer, "write_frame", self.timed("encoding", count_frames=True))
+
+    def wrap(self, obj, name, wrapper):
+        setattr(obj, name, wrapper(getattr(obj, name)))
+
+    def timed(self, phase, count_frames=False):
+        def wrapper(method):
+            def timed_method(*args, **kwargs):
+                start = time.perf_counter()
+                result = method(*args, **kwargs)
+                self.phases[phase] += time.perf_counter() - start
+                if count_frames:
+                    self.phases["frames"] += kwargs.get("num_frames", args[1] if len(args) > 1 else 1)
+                return result
+            return timed_method
+        return wrapper
+
+    def source_line(self):
+        # Innermost caller in the scene's own file, i.e. the self.play/self.wait line
+        frame = sys._getframe()
+        while frame is not None and frame.f_code.co_filename != self.scene_file:
+            frame = frame.f_back
+        return f"{Path(self.scene_file).name}:{frame.f_lineno}" if frame else "?"
+
+    def traced_play(self, play):
+        def wrapper(scene, *args, **kwargs):
+            line = self.source_line()
+            self.phases.clear()
+            rss = current_rss_mb()
+            start = time.perf_counter()
+            play(scene, *args, **kwargs)
+            end = time.perf_counter()
+
+            animations = Counter(type(animation).__name__ for animation in scene.animations or [])
+            self.events.append({
+                "name": ", ".join(animations) or "play", "cat": "play", "ph": "X", "pid": 0, "tid": 0,
+                "ts": (start - self.start)*1e6, "dur": (end - start)*1e6,
+                "args": {
+                    "line": line,
+                    "section": scene.renderer.file_writer.sections[-1].name,
+                    "skipped": scene.renderer.skip_animations,
+                    "animations": dict(animations),
+                    "num_animations": sum(animations.values()),
+                    "num_mobjects": len(scene.mobjects),
+                    "frames": self.phases["frames"],
+                    "interpolation_ms": self.phases["interpolation"]*1e3,
+                    "rasterization_ms": self.phases["rasterization"]*1e3,
+                    "encoding_ms": self.phases["encoding"]*1e3,
+                    "memory_delta_mb": current_rss_mb() - rss,
+                },
+            })
+            self.events.append({"name": "memory", "ph": "C", "pid": 0, "ts": (end - self.start)*1e6,
+                                "args": {"rss_mb": current_rss_mb()}})
+        return wrapper
+
+    def save(self, path):
+        Path(path).write_text(json.dumps({"traceEvents": self.events, "displayTimeUnit": "ms"}))
+        return path
@@ -0,0 +1,145 @@
+import argparse
+import inspect
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from manim import tempconfig
+from manim.constants import QUALITIES as QUALITY_SETTINGS
+
+from assets import precompile_tex
+from checkpoint import Checkpoints
+from profiling import PlayTracer
+from scene import CoDEx
+from writer import ExtraQualities
+
+QUALITIES = {
+    "l": "low_quality",
+    "m": "medium_quality",
+    "h": "high_quality",
+    "p": "production_quality",
+    "k": "fourk_quality",
+}
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Render the CoDEx film, or only some of its sections")
+    parser.add_argument("-s", "--sections", nargs="+", choices=CoDEx.sections, default=list(CoDEx.sections),
+                        help="sections to render, in film order (default: all)")
+    parser.add_argument("-q", "--quality", nargs="+", choices=QUALITIES, default=["h"],
+                        help="output qualities; several are rendered in a single pass (default: h)")
+    parser.add_argument("-p", "--preview", action="store_true", help="open the video when done")
+    parser.add_argument("-j", "--parallel", action="store_true",
+                        help="render each section in its own process and stitch the videos together")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="random seed of the scene; renders with the same seed reuse each other's cached animations")
+    parser.add_argument("-d", "--draft", action="store_true",
+                        help="draft render: fewer stars, scroll frames, image pixels and spectrum vertices, same timing")
+    parser.add_argument("--trace", type=Path,
+                        help="write a Chrome trace of every play/wait here (one file per section with -j)")
+    parser.add_argument("--resume", action="store_true",
+                        help="continue an interrupted render with the same options from its last checkpoint")
+    parser.add_argument("--checkpoint-every", type=int, metavar="N",
+                        help="also checkpoint every N plays, not only at section boundaries")
+    args = parser.parse_args(argv)
+    if args.resume and len(set(args.quality)) > 1:
+        parser.error("--resume renders a single quality, the extra qualities are encoded in one piece")
+    return args
+
+
+def output_name(sections, draft=False):
+    sections = [section for section in CoDEx.sections if section in sections]
+    name = "CoDEx" if sections == list(CoDEx.sections) else "CoDEx_" + "_".join(sections)
+    return name + "_draft" if draft else name
+
+
+def by_resolution(qualities):
+    # Highest resolution first: the scene is built for it and the others are rasterized alongside
+    def size(quality):
+        settings = QUALITY_SETTINGS[QUALITIES[quality]]
+        return settings["pixel_height"], settings["frame_rate"]
+    return sorted(set(qualities), key=size, reverse=True)
+
+
+def quality_config(qualities):
+    # Extra qualities are encoded in one piece, so a play restored from the partial movie cache would leave a gap.
+    # Uncached partial movies are numbered from 0 in every scene, which is safe with -j only because
+    # render_section gives each worker its own partial movie directory
+    if len(qualities) > 1:
+        return {"quality": QUALITIES[qualities[0]], "disable_caching": True}
+    return {"quality": QUALITIES[qualities[0]]}
+
+
+def render_scene(scene, trace=None, extra_qualities=(), resume=False, checkpoint_every=None):
+    # Movie files of the scene, in the order of its quality and then the extra qualities.
+    # Checkpointed unless there are extra qualities, whose single-piece videos can't be resumed
+    checkpoints = None if extra_qualities else Checkpoints(scene, checkpoint_every, resume)
+    if checkpoints and checkpoints.finished:
+        return checkpoints.finished
+    tracer = PlayTracer(scene) if trace else None
+    extras = ExtraQualities(scene, [QUALITIES[quality] for quality in extra_qualities]) if extra_qualities else None
+    scene.render()
+    if tracer:
+        tracer.save(trace)
+    movie_files = [scene.renderer.file_writer.movie_file_path, *(extras.movie_files if extras else [])]
+    if checkpoints:
+        checkpoints.finish(movie_files)
+    return movie_files
+
+
+def render_section(section, qualities, seed, trace=None, draft=False, resume=False, checkpoint_every=None):
+    # Runs in a worker process; the section starts from the state enter_section recreates. Every worker
+    # builds the same scene class, so each gets its own partial movie directory: otherwise they share
+    # one list file and the first to finish may clean up partial movies the others still need
+    name = output_name([section], draft)
+    with tempconfig({**quality_config(qualities), "output_file": name,
+                     "partial_movie_dir": f"{{video_dir}}/partial_movie_files/{name}"}):
+        if trace:
+            trace = trace.with_name(f"{trace.stem}_{section}{trace.suffix}")
+        return render_scene(CoDEx(sections=[section], random_seed=seed, draft=draft), trace, qualities[1:],
+                            resume, checkpoint_every)
+
+
+def concat_videos(movie_files, output_file):
+    # Stream-copy concat, the sections share codec settings so nothing is re-encoded
+    list_file = Path(output_file).with_suffix(".txt")
+    list_file.write_text("".join(f"file '{Path(f).resolve()}'\n" for f in movie_files))
+    subprocess.run(["ffmpeg", "-y", "-loglevel", "error", "-f", "concat", "-safe", "0",
+                    "-i", str(list_file), "-c", "copy", str(output_file)], check=True)
+    list_file.unlink()
+    return output_file
+
+
+def render_parallel(sections, qualities, seed, trace=None, draft=False, resume=False, checkpoint_every=None):
+    sections = [section for section in CoDEx.sections if section in sections]
+    # Fill the tex cache once so the workers don't all compile the same strings
+    with tempconfig(quality_config(qualities)):
+        precompile_tex(inspect.getfile(CoDEx))
+    with ProcessPoolExecutor(max_workers=len(sections)) as pool:
+        n = len(sections)
+        section_files = list(pool.map(render_section, sections, [qualities]*n, [seed]*n, [trace]*n, [draft]*n,
+                                      [resume]*n, [checkpoint_every]*n))
+    # One stitched video per quality
+    output_files = []
+    for movie_files in zip(*section_files):
+        output_file = Path(movie_files[0]).with_name(output_name(sections, draft) + Path(movie_files[0]).suffix)
+        output_files.append(concat_videos(movie_files, output_file))
+    return output_files
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    qualities = by_resolution(args.quality)
+    if args.parallel:
+        output_files = render_parallel(args.sections, qualities, args.seed, args.trace, args.draft,
+                                       args.resume, args.checkpoint_every)
+        print(f"Stitched {len(args.sections)} sections into {', '.join(map(str, output_files))}")
+        return
+    with tempconfig({**quality_config(qualities), "preview": args.preview,
+                     "output_file": output_name(args.sections, args.draft)}):
+        render_scene(CoDEx(sections=args.sections, random_seed=args.seed, draft=args.draft), args.trace,
+                     qualities[1:], args.resume, args.checkpoint_every)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+import subprocess
+from pathlib import Path
+
+from manim.constants import QUALITIES
+from manim.utils.iterables import list_update
+
+
+def bound_encoder_queue(file_writer, depth=8):
+    # manim encodes each partial movie on its own thread, fed by an unbounded queue, so frames can pile
+    # up in memory when rasterizing outruns encoding. Bound the queue of every partial movie stream to
+    # `depth` frames; its get() always signals a waiting put(), so setting maxsize once it exists is enough.
+    # Before manim 0.19 frames are encoded in line and there is no queue to bound
+    open_partial_movie_stream = file_writer.open_partial_movie_stream
+
+    def bounded_open_partial_movie_stream(*args, **kwargs):
+        open_partial_movie_stream(*args, **kwargs)
+        if hasattr(file_writer, "queue"):
+            file_writer.queue.maxsize = depth
+
+    file_writer.open_partial_movie_stream = bounded_open_partial_movie_stream
+
+
+class ExtraOutput:
+    # One more resolution of the scene: a camera sharing the scene camera's frame, static index,
+    # background layers and the current play's pan layers and sprites, and an ffmpeg process encoding the frames it is given into a single video
+    def __init__(self, main_camera, quality, path):
+        settings = QUALITIES[quality]
+        self.frame_rate = settings["frame_rate"]
+        self.camera = type(main_camera)(pixel_width=settings["pixel_width"], pixel_height=settings["pixel_height"],
+                                        frame_rate=self.frame_rate)
+        # Attached after construction, which would otherwise refit the shared frame to this output's aspect ratio
+        for name in ("frame", "static", "background_layers", "pan_layers", "sprites"):
+            if hasattr(main_camera, name):
+                setattr(self.camera, name, getattr(main_camera, name))
+        self.static_image = None
+        self.written = 0
+
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.process = subprocess.Popen([
+            "ffmpeg", "-y", "-loglevel", "error", "-f", "rawvideo", "-pix_fmt", "rgba",
+            "-s", f"{settings['pixel_width']}x{settings['pixel_height']}", "-r", str(self.frame_rate), "-i", "-",
+            "-an", "-c:v", "libx264", "-pix_fmt", "yuv420p", str(self.path),
+        ], stdin=subprocess.PIPE)
+
+    def write(self, num_frames):
+        data = self.camera.pixel_array.tobytes()
+        for _ in range(num_frames):
+            self.process.stdin.write(data)
+        self.written += num_frames
+
+    def close(self):
+        self.process.stdin.close()
+        if self.process.wait():
+            raise RuntimeError(f"ffmpeg failed writing {self.path}")
+
+
+class ExtraQualities:
+    # Renders a scene at more qualities in the same pass: construction, interpolation, TeX and
+    # assets are paid once, and every frame the renderer writes is also rasterized by each extra
+    # output's camera and piped to its encoder. Outputs with a lower frame rate get every n-th frame.
+    # The extra videos are written in one piece rather than as partial movies, so only render with
+    # caching disabled: a play restored from the cache would leave a gap in them
+    def __init__(self, scene, qualities):
+        self.renderer = renderer = scene.renderer
+        self.frame_rate = renderer.camera.frame_rate
+        movie = Path(renderer.file_writer.movie_file_path)
+        self.outputs = [
+            ExtraOutput(renderer.camera, quality, movie.parent.with_name(
+                f"{QUALITIES[quality]['pixel_height']}p{QUALITIES[quality]['frame_rate']}") / movie.name)
+            for quality in qualities
+        ]
+        self.frames = 0
+        self.frame_call = None
+        self.static_mobjects = []
+        self.originals = {name: getattr(renderer, name)
+                          for name in ("update_frame", "save_static_frame_data", "add_frame", "scene_finished")}
+        renderer.update_frame = self.update_frame
+        renderer.save_static_frame_data = self.save_static_frame_data
+        renderer.add_frame = self.add_frame
+        renderer.scene_finished = self.scene_finished
+
+    @property
+    def movie_files(self):
+        return [output.path for output in self.outputs]
+
+    def update_frame(self, scene, mobjects=None, include_submobjects=True, ignore_skipping=True, **kwargs):
+        self.originals["update_frame"](scene, mobjects, include_submobjects, ignore_skipping, **kwargs)
+        # The extra cameras draw the same mobjects, but only for frames they will write
+        self.frame_call = (scene, mobjects, dict(kwargs, include_submobjects=include_submobjects))
+
+    def save_static_frame_data(self, scene, static_mobjects):
+        self.static_mobjects = static_mobjects
+        for output in self.outputs:
+            output.static_image = None
+        return self.originals["save_static_frame_data"](scene, static_mobjects)
+
+    def capture(self, output):
+        scene, mobjects, kwargs = self.frame_call
+        camera = output.camera
+        if self.renderer.static_image is not None:
+            if output.static_image is None:
+                camera.reset()
+                camera.capture_mobjects(self.static_mobjects)
+                output.static_image = camera.pixel_array.copy()
+            camera.set_frame_to_background(output.static_image)
+        else:
+            camera.reset()
+        camera.capture_mobjects(mobjects or list_update(scene.mobjects, scene.foreground_mobjects), **kwargs)
+
+    def add_frame(self, frame, num_frames=1):
+        self.originals["add_frame"](frame, num_frames)
+        if self.renderer.skip_animations:
+            return
+        self.frames += num_frames
+        for output in self.outputs:
+            due = int(self.frames*output.frame_rate/self.frame_rate + 1e-6) - output.written
+            if due > 0:
+                self.capture(output)
+                output.write(due)
+
+    def scene_finished(self, scene):
+        self.originals["scene_finished"](scene)
+        for output in self.outputs:
+            output.close()